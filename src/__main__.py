@@ -1,11 +1,22 @@
 import logging
+import logging.handlers
+import queue
 
 from dotenv import load_dotenv
 
 from .orbot import client
 
-logging.basicConfig(level=logging.INFO)
+# Log records are handed to a queue and written to the console by a background thread
+# - This keeps the console writes, i.e. long tracebacks, off the event loop
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+log_listener.start()
 
 load_dotenv()
 
-client.run()
+try:
+    client.run()
+finally:
+    log_listener.stop()  # Writes the remaining log records before exiting
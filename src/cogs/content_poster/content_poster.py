@@ -273,7 +273,7 @@ class ContentPoster(commands.GroupCog, name="poster"):
         cp_conf = ContentPosterConfig()
         data = cp_conf.get_data()
         data["config"]["feed_channel_id"] = channel.id
-        cp_conf.dump(data)
+        await cp_conf.adump(data)
 
         await asyncio.gather(
             interaction.response.send_message(
@@ -435,7 +435,7 @@ class ContentPoster(commands.GroupCog, name="poster"):
             )
         else:
             data["config"]["post_channels"].append(new_post_channel)
-            cp_conf.dump(data)
+            await cp_conf.adump(data)
 
             await interaction.followup.send(content="A new post channel was successfully added!", ephemeral=True)
 
@@ -504,7 +504,7 @@ class ContentPoster(commands.GroupCog, name="poster"):
             **edited_post_channel,
         }
 
-        cp_conf.dump(data)
+        await cp_conf.adump(data)
 
         await interaction.followup.send(content="The post channel was successfully edited!", ephemeral=True)
 
@@ -542,7 +542,7 @@ class ContentPoster(commands.GroupCog, name="poster"):
         idx, _ = cp_conf.get_post_channel(post_channel)
         del data["config"]["post_channels"][idx]
 
-        cp_conf.dump(data)
+        await cp_conf.adump(data)
 
         await interaction.followup.send(content="The post channel was successfully deleted!", ephemeral=True)
 
@@ -624,9 +624,9 @@ class ContentPoster(commands.GroupCog, name="poster"):
         # Extract relevant tweet information and send the post to the feed channel
         urls_per_post, filenames_per_post, metadata = await TwitterHelper.parse_response_object(tweets)
 
-        for idx, post_urls in enumerate(urls_per_post):
+        for post_urls, post_filenames in zip(urls_per_post, filenames_per_post):
             await TwitterHelper.send_post(
-                urls=post_urls, media_filenames=filenames_per_post[idx], client=self.bot, channel=channel, **metadata
+                urls=post_urls, media_filenames=post_filenames, client=self.bot, channel=channel, **metadata
             )
 
         await interaction.followup.send(content=f"Tweet successfully created in <#{channel.id}>", ephemeral=True)
@@ -749,7 +749,10 @@ class ContentPoster(commands.GroupCog, name="poster"):
                     data["config"]["hashtag_filters"][list_type.value].remove(hashtag)
                     success.append(hashtag)
 
-        cp_conf.dump(data)  # Save data to config file
+        await cp_conf.adump(data)  # Save data to config file
+
+        if self.bot.twitter_stream is not None and self.bot.twitter_stream.stream is not None:
+            self.bot.twitter_stream.stream.reload_config()  # Apply the new filters to the running stream
 
         # Send embed to user to show the user what was/wasn't added/removed
         verb = f"{action.value}ed" if action.value == "add" else f"{action.value}d"
@@ -4,7 +4,6 @@ import discord
 
 from src.typings.content_poster import PostCaptionDetails, PostDetails
 from src.utils.config import ContentPosterConfig
-from src.utils.helper import dict_has_key, get_from_dict
 
 
 def set_embed_author(interaction: discord.Interaction, embed: discord.Embed):
@@ -45,11 +44,10 @@ class PostCaptionEmbed(discord.Embed):
 
         caption = ContentPosterConfig.generate_post_caption(caption_credits, post_caption_details)
 
+        caption_content = post_caption_details.get("caption") if post_caption_details is not None else None
         self.add_field(
             name="Caption Content",
-            value=f'{post_caption_details["caption"]}\n\u200B'
-            if post_caption_details is not None and dict_has_key(post_caption_details, "caption")
-            else "_-No content entered-_\n\u200B",
+            value=f"{caption_content}\n\u200B" if caption_content is not None else "_-No content entered-_\n\u200B",
             inline=False,
         )
         self.add_field(
@@ -78,24 +76,27 @@ class PostDetailsEmbed(discord.Embed):
     def __init__(self, post_details: PostDetails, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        if dict_has_key(post_details, "message"):
+        message = post_details.get("message")
+        if message is not None:
             self.title = "Edit Post"
-            self.description = f"Edits the post made in <#{post_details['message'].channel.id}> with a message ID of {post_details['message'].id}\n\u200B"
+            self.description = (
+                f"Edits the post made in <#{message.channel.id}> with a message ID of {message.id}\n\u200B"
+            )
         else:
             self.title = "New Post"
             self.description = f"Enter details to make a new post for {post_details['tweet_url']}\n\u200B"
 
+        caption = post_details.get("caption")
         self.add_field(
             name="Caption",
-            value=f'{post_details["caption"]}\u200B'
-            if get_from_dict(post_details, ["caption"]) is not None
-            else "_-No caption entered-_\n\u200B",
+            value=f"{caption}\u200B" if caption is not None else "_-No caption entered-_\n\u200B",
             inline=False,
         )
+        channels = post_details.get("channels")
         self.add_field(
             name="Channel(s)",
-            value=f"<#{'>, <#'.join(post_details['channels'])}>\n\u200B"
-            if dict_has_key(post_details, "channels")
+            value=f"<#{'>, <#'.join(channels)}>\n\u200B"
+            if channels is not None
             else "_-No channel(s) selected-_\n\u200B",
             inline=False,
         )
@@ -12,7 +12,7 @@ from src.cogs.content_poster.ui.views.post_details import (
 from src.modules.ui.common import Button, View
 from src.typings.content_poster import PostDetails
 from src.utils.config import ContentPosterConfig
-from src.utils.helper import dict_has_key, get_from_dict
+from src.utils.helper import get_from_dict
 from src.utils.user_input import get_user_input, send_input_message
 
 
@@ -164,7 +164,7 @@ class EditPostView(View):
             bot=self.bot,
             interaction=interaction,
             embed_type="edit",
-            default_caption=self.post_details["caption"] if dict_has_key(self.post_details, "caption") else None,
+            default_caption=self.post_details.get("caption"),
         )
 
         self.active_views.append(post_caption_view)
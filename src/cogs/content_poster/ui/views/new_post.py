@@ -199,11 +199,8 @@ class NewPostView(View):
 
         # The following for loop is to make it so that the Discord files are read from the first byte again after being sent as a message earlier
         # Being sent as a message initially means the byte-file pointer is at the end
-        files = []
         for media in self.post_details["files"]:
-            with media.fp as media_binary:
-                media_binary.seek(0)
-                files.append(discord.File(media_binary, media.filename))
+            media.fp.seek(0)
 
         await post_channel.send(content=get_from_dict(self.post_details, ["caption"]), files=self.post_details["files"])
 
@@ -219,7 +216,7 @@ class NewPostView(View):
             bot=self.bot,
             interaction=interaction,
             embed_type="new",
-            default_caption=self.post_details["caption"] if dict_has_key(self.post_details, "caption") else None,
+            default_caption=self.post_details.get("caption"),
         )
 
         self.active_views.append(post_caption_view)
@@ -259,7 +256,7 @@ class NewPostView(View):
             input_type="select",
             stop_view=False,
             defer=True,
-            defaults=self.post_details["channels"] if dict_has_key(self.post_details, "channels") else None,
+            defaults=self.post_details.get("channels"),
         )
 
         await interaction.response.send_message(
@@ -1,4 +1,5 @@
-from typing import List
+import asyncio
+from typing import List, Optional
 
 import discord
 
@@ -7,6 +8,7 @@ from src.cogs.content_poster.ui.views.new_post import NewPostView
 from src.modules.ui.common import Button, View
 from src.typings.content_poster import PostDetails, TweetDetails
 from src.utils.config import ContentPosterConfig
+from src.utils.helper import send_or_edit_interaction_message
 
 
 class PersistentTweetView(View):
@@ -20,8 +22,9 @@ class PersistentTweetView(View):
             - The message with the `PostDetailsEmbed`.
         * tweet_details: :class:`TweetDetails`
             - Necessary details extrapolated from a Tweet object.
-        * files: List[:class:`discord.File`]
+        * files: Optional[List[:class:`discord.File`]]
             - A copied reference list to the original files found in the Posts' attachment attribute.
+            - If `None` is provided, the files are downloaded from the message attachments when they are first needed.
         * bot: :class:`discord.Client`
             - The Discord bot instance needed to wait for user input.
     """
@@ -29,7 +32,7 @@ class PersistentTweetView(View):
     def __init__(
         self,
         message: discord.Message,
-        files: List[discord.File],
+        files: Optional[List[discord.File]],
         tweet_details: TweetDetails,
         bot: discord.Client,
         *args,
@@ -83,18 +86,24 @@ class PersistentTweetView(View):
     # =================================================================================================================
     async def new_post(self, interaction: discord.Interaction, *_):
         """Callback attached to the `new_post` button which sends a `PostDetailsEmbed` and a `NewPostView` to allow users to create a new post."""
+        if self.files is None:
+            # Defer first as downloading the attachments may take longer than the interaction response deadline
+            await interaction.response.defer(thinking=True)
+            self.files = list(await asyncio.gather(*[attachment.to_file() for attachment in self.message.attachments]))
+
         # Send user a `PostDetailsEmbed` to keep track of the entered information
         post_details = PostDetails(
             files=self.files,
             caption_credits=(self.tweet_details["user"]["name"], self.tweet_details["user"]["username"]),
             tweet_url=self.tweet_details["url"],
         )
-        await interaction.response.send_message(
-            embed=set_embed_author(interaction=interaction, embed=PostDetailsEmbed(post_details=post_details))
+        self.embedded_message = await send_or_edit_interaction_message(
+            interaction=interaction,
+            edit_original_response=True,
+            embed=set_embed_author(interaction=interaction, embed=PostDetailsEmbed(post_details=post_details)),
         )
 
         # Edit the previous message with a `NewPostView`
-        self.embedded_message = await interaction.original_response()
         new_post_view = NewPostView(
             bot=self.bot,
             post_details=post_details,
@@ -7,7 +7,6 @@ from src.cogs.content_poster.ui.embeds import PostCaptionEmbed, set_embed_author
 from src.modules.ui.common import Button, Select, View
 from src.typings.content_poster import PostCaptionDetails
 from src.utils.config import ContentPosterConfig
-from src.utils.helper import dict_has_key
 from src.utils.user_input import get_user_input, send_input_message
 
 
@@ -269,8 +268,7 @@ class PostCaptionView(View):
 
     @discord.ui.button(style=discord.ButtonStyle.grey, emoji="🗑", row=0)
     async def clear_caption(self, interaction: discord.Interaction, *_):
-        if dict_has_key(self.post_caption_details, "caption"):
-            del self.post_caption_details["caption"]
+        self.post_caption_details.pop("caption", None)
 
         await asyncio.gather(
             self.embedded_message.edit(
@@ -768,7 +768,7 @@ class GoogleForms(commands.GroupCog, name="google"):
                     else:
                         nonrenewable_watch_ids.append(f"`{watch['watch_id']}`")
 
-                gc_conf.dump(data=data)
+                await gc_conf.adump(data)
 
                 # Notify users of nonrenewable watch IDs
                 await send_or_edit_interaction_message(
@@ -96,7 +96,7 @@ class RolePicker(commands.GroupCog, name="role-picker"):
             data["role_picker"] = {}
             data["role_picker"]["setup"] = {"message_id": message.id, "channel_id": scope.id}
 
-            rp_conf.dump(data)
+            await rp_conf.adump(data)
 
     # =================================================================================================================
     # GENERAL SLASH COMMANDS
@@ -214,7 +214,7 @@ class RolePicker(commands.GroupCog, name="role-picker"):
 
         data["categories"]["role_categories"].append(new_category)
 
-        rp_conf.dump(data)
+        await rp_conf.adump(data)
 
         # Update Role Picker message
         await self.setup_or_refresh(modal.interaction.guild)
@@ -301,7 +301,7 @@ class RolePicker(commands.GroupCog, name="role-picker"):
 
             data[role_category]["roles"].append(new_role)
 
-        rp_conf.dump(data)
+        await rp_conf.adump(data)
 
         # Update Role Picker message
         await self.setup_or_refresh(role_modal.interaction.guild)
@@ -375,7 +375,7 @@ class RolePicker(commands.GroupCog, name="role-picker"):
 
         data[edited_category["name"]] = data.pop(role_category)  # Replace the old key with the new key
 
-        rp_conf.dump(data)
+        await rp_conf.adump(data)
 
         # Update Role Picker message
         await self.setup_or_refresh(role_category_modal.interaction.guild)
@@ -448,7 +448,7 @@ class RolePicker(commands.GroupCog, name="role-picker"):
             data = rp_conf.get_data()
             data[role_category]["roles"][idx] = {**data[role_category]["roles"][idx], **edited_role}
 
-            rp_conf.dump(data)
+            await rp_conf.adump(data)
 
             # Update Role Picker message
             await self.setup_or_refresh(role_modal.interaction.guild)
@@ -498,7 +498,7 @@ class RolePicker(commands.GroupCog, name="role-picker"):
             if dict_has_key(data, role_category):
                 del data[role_category]  # Delete key | attribute from the `roles.yaml` file itself
 
-        rp_conf.dump(data)
+        await rp_conf.adump(data)
 
         # Update Role Picker message
         await self.setup_or_refresh(role_category_view.interaction.guild)
@@ -565,7 +565,7 @@ class RolePicker(commands.GroupCog, name="role-picker"):
             else:
                 data[role_category]["roles"] = roles_to_keep
 
-            rp_conf.dump(data)
+            await rp_conf.adump(data)
 
             # Update Role Picker message
             await self.setup_or_refresh(roles_view.interaction.guild)
@@ -248,29 +248,26 @@ class RolesOverviewView(View):
 
     def update_curr_idx(self, increment):
         """Updates the current index of the list of embeds"""
-        if self.curr_idx + increment == len(self.embeds):
-            self.curr_idx = 0
-        elif self.curr_idx + increment < 0:
-            self.curr_idx = len(self.embeds) - 1
-        else:
-            self.curr_idx = self.curr_idx + increment
-
+        self.curr_idx = (self.curr_idx + increment) % len(self.embeds)  # Wraps around in both directions
         return self.curr_idx
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.primary, emoji="⬅️")
     async def previous(self, interaction: discord.Interaction, *_):
         self.value = False
-        await interaction.response.edit_message(embed=self.embeds[self.update_curr_idx(-1)])
+        await interaction.response.defer()
+        await interaction.edit_original_response(embed=self.embeds[self.update_curr_idx(-1)])
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.primary, emoji="➡️")
     async def next(self, interaction: discord.Interaction, *_):
         self.value = True
-        await interaction.response.edit_message(embed=self.embeds[self.update_curr_idx(1)])
+        await interaction.response.defer()
+        await interaction.edit_original_response(embed=self.embeds[self.update_curr_idx(1)])
 
     @discord.ui.button(style=discord.ButtonStyle.red, emoji="🔒")
     async def lock(self, interaction: discord.Interaction, *_):
         self.stop()
-        await interaction.response.edit_message(view=None)
+        await interaction.response.defer()
+        await interaction.edit_original_response(view=None)
 
 
 # =================================================================================================================
@@ -1,13 +1,10 @@
 import discord
 from google.oauth2 import service_account
 from google_auth_oauthlib import flow
-from ruamel.yaml import YAML
 
 from src.cogs.google_forms.ui.view import AuthenticationLinkView
 from src.utils.helper import send_or_edit_interaction_message
 
-yaml = YAML(typ="safe")
-
 
 class GoogleCredentialsHelper:
     """A class comprised of static resources to handle authentication using the Google APIs."""
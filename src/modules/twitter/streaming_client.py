@@ -2,13 +2,14 @@ import asyncio
 import json
 import logging
 import os
+import sys
+from collections import OrderedDict
 
 import discord
 from tweepy.asynchronous import AsyncStreamingClient
 
 from src.modules.twitter.twitter import TwitterHelper
 from src.utils.config import ContentPosterConfig
-from src.utils.helper import dict_has_key, get_from_dict
 
 
 class TwitterStreamingClient(AsyncStreamingClient):
@@ -20,15 +21,34 @@ class TwitterStreamingClient(AsyncStreamingClient):
             - The client instance that will be used to send messages.
     """
 
-    url_postfix = ":orig"
+    # Static class variables
+    max_pending_conversations = 1024  # Caps the number of Twitter threads held in memory while waiting to be compiled
 
     def __init__(self, client: discord.Client):
         # The `wait_on_rate_limit` argument prevents the streaming client from shutting off when the API rate limit is reached
         super().__init__(bearer_token=os.getenv("TWITTER_BEARER_TOKEN"), wait_on_rate_limit=True, max_retries=5)
         self.client = client
-        self.channel = ContentPosterConfig().get_feed_channel(self.client)
-        self.tweets = {}
+        self.reload_config()
+        self.channel = self.cp_conf.get_feed_channel(self.client)
+        self.tweets: OrderedDict[str, list] = OrderedDict()
         self.status = ""
+        self._bg_tasks = set()  # Holds strong references so pending tasks are not garbage collected mid-flight
+
+    def create_background_task(self, coro):
+        """Schedules a coroutine on the running event loop and keeps a reference to it until it is done."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    def reload_config(self):
+        """Reloads the cached `ContentPosterConfig`, i.e. after the hashtag filters have been edited."""
+        self.cp_conf = ContentPosterConfig()
+
+        # Normalize the filters once so each incoming hashtag only needs to be casefolded on its side
+        hashtag_filters = self.cp_conf.hashtag_filters
+        self.whitelisted_tags = frozenset(str(tag).casefold() for tag in hashtag_filters["whitelist"])
+        self.blacklisted_tags = frozenset(str(tag).casefold() for tag in hashtag_filters["blacklist"])
 
     def is_valid_tweet(self, tweet: dict):
         """A function that checks whether the Tweets hashtag passes the hashtag filter.
@@ -38,18 +58,19 @@ class TwitterStreamingClient(AsyncStreamingClient):
             * tweet: :class:`dict`
                 - The Tweet to filter.
         """
-        hashtag_filters = ContentPosterConfig().hashtag_filters
-
-        hashtags = get_from_dict(tweet, ["data", "entities", "hashtags"])
+        try:
+            hashtags = tweet["data"]["entities"]["hashtags"]
+        except KeyError:  # Tweets without hashtags do not have the `entities.hashtags` object
+            return False
 
         if hashtags is not None:
             whitelisted_tags = []
             blacklisted_tags = []
 
             for hashtag_metadata in hashtags:
-                tag = get_from_dict(hashtag_metadata, ["tag"]).lower()
-                whitelisted_tags.append(tag in hashtag_filters["whitelist"])
-                blacklisted_tags.append(tag in hashtag_filters["blacklist"])
+                tag = hashtag_metadata["tag"].casefold()
+                whitelisted_tags.append(tag in self.whitelisted_tags)
+                blacklisted_tags.append(tag in self.blacklisted_tags)
 
             return not any(blacklisted_tags) and any(whitelisted_tags)
         return False
@@ -66,21 +87,18 @@ class TwitterStreamingClient(AsyncStreamingClient):
         """
         await asyncio.sleep(delay)
 
-        tweets = self.tweets[conversation_id]
+        # Remove the thread before parsing so that it can't linger in memory if parsing fails
+        tweets = self.tweets.pop(conversation_id, None)
 
-        urls_per_post, filenames_per_post, metadata = await TwitterHelper.parse_response_raw_data(tweets)
+        if tweets is None:  # The thread was evicted because there were too many pending threads
+            return
 
-        del self.tweets[conversation_id]
+        urls_per_post, filenames_per_post, metadata = await TwitterHelper.parse_response_raw_data(tweets)
 
-        for idx, post_urls in enumerate(urls_per_post):
-            loop = asyncio.get_event_loop()
-            loop.create_task(
+        for post_urls, post_filenames in zip(urls_per_post, filenames_per_post):
+            self.create_background_task(
                 TwitterHelper.send_post(
-                    urls=post_urls,
-                    media_filenames=filenames_per_post[idx],
-                    client=self.client,
-                    channel=self.channel,
-                    **metadata
+                    urls=post_urls, media_filenames=post_filenames, client=self.client, channel=self.channel, **metadata
                 )
             )
 
@@ -108,14 +126,23 @@ class TwitterStreamingClient(AsyncStreamingClient):
         # The conversation ID is a unique identifier used to identify which tweets belong to the same Twitter thread
         # Therefore, it is used as the dictionary key to reconstruct the Twitter thread
         # Reconstructing the thread is important to tell which images belong to the same event
-        conversation_id = get_from_dict(data, ["data", "conversation_id"])
+        # Stream messages without a Tweet, i.e. operational disconnects and errors, do not have a conversation ID
+        conversation_id = data.get("data", {}).get("conversation_id")
+        if conversation_id is None:
+            return
+
+        # Interning the ID lets the repeated dictionary lookups compare keys by identity
+        conversation_id = sys.intern(conversation_id)
 
         # Checks whether the Twitter thread has been recorded before
-        if dict_has_key(self.tweets, conversation_id):
-            self.tweets[conversation_id].append(data)
+        thread_tweets = self.tweets.get(conversation_id)
+        if thread_tweets is not None:
+            thread_tweets.append(data)
         elif self.is_valid_tweet(data):
             self.tweets[conversation_id] = [data]
 
+            if len(self.tweets) > self.max_pending_conversations:
+                self.tweets.popitem(last=False)  # Evict the oldest pending thread
+
             # The following runs asynchronous tasks in a coroutine so that it doesn't block the main event loop
-            loop = asyncio.get_event_loop()
-            loop.create_task(self.compile_tweets(conversation_id))
+            self.create_background_task(self.compile_tweets(conversation_id))
@@ -1,6 +1,6 @@
 import asyncio
 import re
-from operator import itemgetter
+from itertools import islice
 from typing import List
 
 import discord
@@ -9,12 +9,7 @@ from requests import Response
 
 from src.cogs.content_poster.ui.views.persistent import PersistentTweetView
 from src.typings.content_poster import TweetDetails
-from src.utils.helper import (
-    convert_files_to_zip,
-    dict_has_key,
-    download_files,
-    get_from_dict,
-)
+from src.utils.helper import convert_files_to_zip, download_files
 
 
 class TwitterHelper:
@@ -40,8 +35,14 @@ class TwitterHelper:
                 urls.append(f"{media_object['url']}{TwitterHelper.url_postfix}")
                 filenames.append(filename)
             else:
-                variants = [variant for variant in media_object["variants"] if dict_has_key(variant, "bit_rate")]
-                highest_bit_rate_variant = max(variants, key=itemgetter("bit_rate"))
+                # Find the variant with the highest bit rate in a single pass, skipping variants without one
+                highest_bit_rate_variant = None
+                highest_bit_rate = -1
+                for variant in media_object["variants"]:
+                    bit_rate = variant.get("bit_rate")
+                    if bit_rate is not None and bit_rate > highest_bit_rate:
+                        highest_bit_rate = bit_rate
+                        highest_bit_rate_variant = variant
 
                 filename = highest_bit_rate_variant["url"].split("/")[-1]
                 filename = re.sub(r"\?.+", "", filename)
@@ -52,7 +53,7 @@ class TwitterHelper:
 
     @staticmethod
     def get_items_per_post(items: list, items_per_post: int = 10):
-        """Partitions a list of objects into a multiple lists not more than a certain length.
+        """Lazily partitions a list of objects into multiple lists not more than a certain length.
 
         Parameters
         ----------
@@ -61,7 +62,20 @@ class TwitterHelper:
             * items_per_post: :class:`int` | 10
                 - The maximum array length for each partition. Default is 10, as Discord only allows 10 media attachments per post.
         """
-        return [items[i : i + items_per_post] for i in range(0, len(items), items_per_post)]
+        iterator = iter(items)
+        while chunk := list(islice(iterator, items_per_post)):
+            yield chunk
+
+    @staticmethod
+    def get_tweet_url(expanded_url: str):
+        """Removes the /photo/1 or /media/1 postfixes from an expanded media URL to obtain the Tweet URL.
+
+        Parameters
+        ----------
+            * expanded_url: :class:`str`
+                - The expanded URL of the Tweet media.
+        """
+        return expanded_url.rsplit("/", 2)[0]
 
     @staticmethod
     async def parse_response_object(tweets: Response):
@@ -84,7 +98,7 @@ class TwitterHelper:
 
         metadata = {
             "user": tweets.includes["users"][0].data,
-            "tweet_url": expanded_url.rsplit("/", 2)[0],
+            "tweet_url": TwitterHelper.get_tweet_url(expanded_url),
             "conversation_id": tweet["conversation_id"],
             "tweet_text": tweet["text"].replace(tweet_url, ""),
         }
@@ -99,16 +113,15 @@ class TwitterHelper:
         ----------
             * tweets: :class:`dict`
         """
-        urls = get_from_dict(tweets[0], ["data", "entities", "urls"])[
-            -1
-        ]  # Take the last one because it is the link to the Tweet
+        first_tweet = tweets[0]
+        urls = first_tweet["data"]["entities"]["urls"][-1]  # Take the last one because it is the link to the Tweet
         expanded_url = urls["expanded_url"]
         tweet_url = urls["url"]
 
         media_urls = []
         media_filenames = []
         for tweet in tweets:
-            medias = get_from_dict(tweet, ["includes", "media"])
+            medias = tweet["includes"]["media"]
             urls, filenames = TwitterHelper.get_media_urls(medias)
 
             media_urls.extend(urls)
@@ -118,10 +131,10 @@ class TwitterHelper:
         filenames_per_post = TwitterHelper.get_items_per_post(media_filenames)
 
         metadata = {
-            "user": get_from_dict(tweets[0], ["includes", "users"])[0],
-            "tweet_url": expanded_url.rsplit("/", 2)[0],  # Removes the /photo/1 or /media/1 postfixes
-            "conversation_id": get_from_dict(tweets[0], ["data", "conversation_id"]),
-            "tweet_text": get_from_dict(tweets[0], ["data", "text"]).replace(tweet_url, ""),
+            "user": first_tweet["includes"]["users"][0],
+            "tweet_url": TwitterHelper.get_tweet_url(expanded_url),
+            "conversation_id": first_tweet["data"]["conversation_id"],
+            "tweet_text": first_tweet["data"]["text"].replace(tweet_url, ""),
         }
 
         return urls_per_post, filenames_per_post, metadata
@@ -1,10 +1,10 @@
+import logging
 import re
-import traceback
-from typing import Any, Awaitable, Callable, List, Optional, Union
+from typing import Any, Awaitable, Callable
 
 import discord
 
-from src.utils.helper import dict_has_key
+logger = logging.getLogger(__name__)
 
 
 class Select(discord.ui.Select):
@@ -22,9 +22,7 @@ class Select(discord.ui.Select):
             - Defers the Interaction in the Buttons callback.
     """
 
-    def __init__(
-        self, name: Optional[str] = None, stop_view: bool = False, defer: bool = False, *args, **kwargs
-    ) -> None:
+    def __init__(self, name: str | None = None, stop_view: bool = False, defer: bool = False, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.name = name
         self.stop_view = stop_view
@@ -68,11 +66,11 @@ class Button(discord.ui.Button):
 
     def __init__(
         self,
-        name: Optional[str] = None,
-        value: Optional[Any] = None,
+        name: str | None = None,
+        value: Any | None = None,
         stop_view: bool = False,
         defer: bool = False,
-        custom_callback: Optional[Callable[[discord.Interaction, discord.ui.Button], Awaitable[None]]] = None,
+        custom_callback: Callable[[discord.Interaction, discord.ui.Button], Awaitable[None]] | None = None,
         *args,
         **kwargs,
     ):
@@ -121,11 +119,11 @@ class View(discord.ui.View):
             - Returns the Interaction object from an item. Can only return one Interaction object from one item. Can be `None` type.
     """
 
-    def __init__(self, *, timeout: Optional[float] = None):
+    def __init__(self, *, timeout: float | None = None):
         super().__init__(timeout=timeout)
         self.ret_val = None
         self.ret_dict = {}
-        self.interaction: Optional[discord.Interaction] = None
+        self.interaction: discord.Interaction | None = None
 
 
 class Modal(discord.ui.Modal):
@@ -141,6 +139,7 @@ class Modal(discord.ui.Modal):
             - Displays an error response. If `None` is provided, the Interaction is deferred.
         * checks: Optional[List[:class:`dict`]]
             - Denotes the validation to be made to inputs with custom IDs. Has the dictionary has the keys of `custom_id` and `regex`.
+            - Only one check can be made per input, a later check replaces an earlier check with the same `custom_id`.
             - The type of checks supported: RegEx string matching
             - `custom_id` key: Denotes the `custom_id` of the input to apply the check to
             - `regex` key: The string to be matched
@@ -153,9 +152,9 @@ class Modal(discord.ui.Modal):
 
     def __init__(
         self,
-        success_msg: Optional[str] = None,
-        error_msg: Optional[str] = None,
-        checks: Optional[List[dict]] = None,
+        success_msg: str | None = None,
+        error_msg: str | None = None,
+        checks: list[dict] | None = None,
         *args,
         **kwargs,
     ) -> None:
@@ -163,19 +162,20 @@ class Modal(discord.ui.Modal):
         self.success_msg = success_msg
         self.error_msg = error_msg
         self.checks = checks
+        self.compiled_checks = (
+            {check["custom_id"]: re.compile(check["regex"], re.I) for check in checks} if checks is not None else None
+        )  # Maps the custom IDs of the inputs to their compiled regex
         self.interaction = None
 
     def get_values(self):
-        return {child.custom_id: child.value for child in self.children if child.value}
+        return {child.custom_id: value for child in self.children if (value := child.value)}
 
     def validate(self):
-        values = self.get_values()
+        compiled_checks = self.compiled_checks
         return all(
-            [
-                bool(re.match(check["regex"], values[check["custom_id"]], re.I))
-                for check in self.checks
-                if dict_has_key(values, check["custom_id"])
-            ]
+            bool(pattern.match(value))
+            for custom_id, value in self.get_values().items()
+            if (pattern := compiled_checks.get(custom_id)) is not None
         )
 
     async def on_submit(self, interaction: discord.Interaction):
@@ -183,7 +183,7 @@ class Modal(discord.ui.Modal):
             raise Exception("Invalid form input")
 
         if self.success_msg is not None:
-            await interaction.response.send_message(f"{self.success_msg}", ephemeral=True)
+            await interaction.response.send_message(self.success_msg, ephemeral=True)
         else:
             await interaction.response.defer()
 
@@ -192,9 +192,9 @@ class Modal(discord.ui.Modal):
 
     async def on_error(self, interaction: discord.Interaction, error: Exception) -> None:
         if self.error_msg is not None:
-            await interaction.response.send_message(f"{self.error_msg}", ephemeral=True)
+            await interaction.response.send_message(self.error_msg, ephemeral=True)
         else:
             await interaction.response.defer()
 
         self.interaction = interaction
-        traceback.print_tb(error.__traceback__)
+        logger.error("Error in %s", self.__class__.__name__, exc_info=error)
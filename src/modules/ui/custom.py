@@ -1,5 +1,3 @@
-from typing import List, Optional
-
 import discord
 
 from src.modules.ui.common import View
@@ -8,7 +6,7 @@ from src.modules.ui.common import View
 class CancelView(View):
     """Creates a view with a cancel button by inheriting the `View` class."""
 
-    def __init__(self, *, timeout: Optional[float] = None):
+    def __init__(self, *, timeout: float | None = None):
         super().__init__(timeout=timeout)
         self.interaction = None
 
@@ -28,36 +26,34 @@ class PaginatedEmbedsView(View):
             - List of embeds to iterate through.
     """
 
-    def __init__(self, embeds: List[discord.Embed], *args, **kwargs):
+    def __init__(self, embeds: list[discord.Embed], *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.embeds = embeds
+        self.embeds = tuple(embeds)  # The embeds don't change once the view is created
+        self.num_embeds = len(self.embeds)
         self.curr_idx = 0
 
     def update_curr_idx(self, increment: int):
         """Updates the current index of the list of embeds"""
-        if self.curr_idx + increment == len(self.embeds):
-            self.curr_idx = 0
-        elif self.curr_idx + increment < 0:
-            self.curr_idx = len(self.embeds) - 1
-        else:
-            self.curr_idx = self.curr_idx + increment
-
+        self.curr_idx = (self.curr_idx + increment) % self.num_embeds  # Wraps around in both directions
         return self.curr_idx
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.primary, emoji="⬅️")
     async def previous(self, interaction: discord.Interaction, *_):
         self.value = False
-        await interaction.response.edit_message(embed=self.embeds[self.update_curr_idx(-1)])
+        await interaction.response.defer()
+        await interaction.edit_original_response(embed=self.embeds[self.update_curr_idx(-1)])
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.primary, emoji="➡️")
     async def next(self, interaction: discord.Interaction, *_):
         self.value = True
-        await interaction.response.edit_message(embed=self.embeds[self.update_curr_idx(1)])
+        await interaction.response.defer()
+        await interaction.edit_original_response(embed=self.embeds[self.update_curr_idx(1)])
 
     @discord.ui.button(style=discord.ButtonStyle.red, emoji="🔒")
     async def lock(self, interaction: discord.Interaction, *_):
         self.stop()
-        await interaction.response.edit_message(view=None)
+        await interaction.response.defer()
+        await interaction.edit_original_response(view=None)
 
 
 class ConfirmationView(View):
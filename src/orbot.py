@@ -1,15 +1,17 @@
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import discord
 from discord.ext import commands
 
-from src.cogs.content_poster.ui.views.persistent import PersistentTweetView
-from src.cogs.role_picker.ui import PersistentRolePickerView
-from src.modules.auth.google_credentials import GoogleCredentialsHelper
-from src.modules.google_forms.topic_listener import GoogleTopicListenerManager
-from src.modules.twitter.feed import TwitterFeed
-from src.utils.config import ContentPosterConfig, GoogleCloudConfig
+if TYPE_CHECKING:
+    from src.modules.google_forms.topic_listener import GoogleTopicListenerManager
+    from src.modules.twitter.feed import TwitterFeed
 
 intents = discord.Intents(
     guilds=True,
@@ -20,16 +22,36 @@ intents = discord.Intents(
     message_content=True,
 )
 
+logger = logging.getLogger(__name__)
+
 MY_GUILD = discord.Object(id=864118528134742026)
 
+COMMAND_SIGNATURE_PATH = "src/data/command_signature.txt"  # Stores the hash of the last synced command tree
+
+EXCLUDED_COG_DIRS = frozenset({"__pycache__", ".mypy_cache", "__init__"})  # Directories that aren't cogs
+
+
+@functools.lru_cache(maxsize=1)
+def discover_cogs(cogs_path: str, cogs_ext_prefix: str) -> Tuple[str, ...]:
+    """Finds the extension names of the cogs in the cogs directory.
+
+    The result is cached as the cogs directory doesn't change while the bot is running.
+    """
+    with os.scandir(cogs_path) as entries:
+        return tuple(
+            f"{cogs_ext_prefix}{entry.name}.{entry.name}"
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False) and entry.name not in EXCLUDED_COG_DIRS
+        )
+
 
 class Orbot(commands.Bot):
     def __init__(self):
         super().__init__(command_prefix=">", case_insensitive=True, intents=intents)
         self.cogs_path = "src/cogs"
         self.cogs_ext_prefix = "src.cogs."
-        self.twitter_stream = None
-        self.listener = None
+        self.twitter_stream: Optional[TwitterFeed] = None
+        self.listener: Optional[GoogleTopicListenerManager] = None
 
     def run(self):
         super().run(os.getenv("DEV_TOKEN"))
@@ -39,44 +61,81 @@ class Orbot(commands.Bot):
         await super().start(*args, **kwargs)
 
     async def close(self):
-        if self.twitter_stream is not None and self.twitter_stream.stream is not None:
-            await self.twitter_stream.close()
+        twitter_stream = self.twitter_stream  # Stays `None` if the bot closes before `on_ready` starts the stream
+        if getattr(twitter_stream, "stream", None) is not None:
+            await twitter_stream.close()
 
         if self.listener:
             self.listener.close_all_streams()
-            logging.info("All streams shut down successfully")
+            logger.info("All streams shut down successfully")
 
-        logging.info("Orbot is shutting down... Goodbye!")
+        logger.info("Orbot is shutting down... Goodbye!")
         await super().close()
 
     async def setup_hook(self):
+        # The UI modules pull in the config and Twitter modules, so they are only imported once the bot is starting up
+        from src.cogs.role_picker.ui import PersistentRolePickerView
+
         self.add_view(PersistentRolePickerView())
         await self.reactivate_persistent_views()
         self.tree.copy_global_to(guild=MY_GUILD)
-        await self.tree.sync(guild=MY_GUILD)
+        await self.sync_command_tree()
+
+    async def sync_command_tree(self):
+        """Syncs the command tree with Discord, skipping the sync if the commands haven't changed since the last sync."""
+        # The application and guild are part of the signature, so switching either of them always syncs
+        sync_payload = {
+            "application_id": self.application_id,
+            "guild_id": MY_GUILD.id,
+            "commands": [command.to_dict(self.tree) for command in self.tree.get_commands(guild=MY_GUILD)],
+        }
+        signature = hashlib.sha256(json.dumps(sync_payload, sort_keys=True).encode()).hexdigest()
+
+        try:
+            with open(COMMAND_SIGNATURE_PATH, "r") as signature_file:
+                if signature_file.read().strip() == signature:
+                    logger.info(
+                        "Command tree is unchanged since the last sync, skipping sync. Delete %s to force a sync",
+                        COMMAND_SIGNATURE_PATH,
+                    )
+                    return
+        except FileNotFoundError:
+            pass
+
+        try:
+            await asyncio.wait_for(self.tree.sync(guild=MY_GUILD), timeout=10)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out while syncing the command tree")
+            return
+
+        with open(COMMAND_SIGNATURE_PATH, "w") as signature_file:
+            signature_file.write(signature)
 
     async def load_extensions(self):
-        cogs = map(
-            lambda cog: f"{self.cogs_ext_prefix}{cog}.{cog}",
-            [
-                dirname.split(".", 1)[0]
-                for dirname in next(os.walk(self.cogs_path), (None, None, []))[1]
-                if dirname.split(".", 1)[0] not in ["__pycache__"]
-            ],
-        )
+        extensions = discover_cogs(self.cogs_path, self.cogs_ext_prefix)
 
-        extensions = list(cogs)
+        # Load the extensions concurrently so that one failing cog doesn't prevent the rest from loading
+        results = await asyncio.gather(
+            *[self.load_extension(extension) for extension in extensions], return_exceptions=True
+        )
 
-        for extension in extensions:
-            await self.load_extension(extension)
+        for extension, result in zip(extensions, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to load extension %s", extension, exc_info=result)
 
     async def on_ready(self):
+        from src.modules.auth.google_credentials import GoogleCredentialsHelper
+        from src.modules.twitter.feed import TwitterFeed
+
         self.twitter_stream = await TwitterFeed.init_then_start(client=self)
         GoogleCredentialsHelper.set_service_acc_cred()
         self.setup_google_topic_listeners()
-        logging.info("Orbot is ready")
+        logger.info("Orbot is ready")
 
     async def reactivate_persistent_views(self):
+        from src.cogs.content_poster.ui.views.persistent import PersistentTweetView
+        from src.utils.config import ContentPosterConfig
+
         cp_conf = ContentPosterConfig()
 
         active_posts = cp_conf.active_posts
@@ -86,19 +145,29 @@ class Orbot(commands.Bot):
             return
 
         channel = await self.fetch_channel(feed_channel_id)
+        semaphore = asyncio.Semaphore(20)  # Limits the number of concurrent requests to avoid hitting rate limits
 
-        for msg_id, tweet_details in active_posts.items():
-            message = await channel.fetch_message(msg_id)
-            files = [await attachment.to_file() for attachment in message.attachments]
+        async def fetch_active_post(msg_id: str):
+            async with semaphore:
+                return await channel.fetch_message(msg_id)
 
-            self.add_view(PersistentTweetView(message=message, files=files, tweet_details=tweet_details, bot=self))
+        # Fetch the messages concurrently
+        # The attachments are only downloaded when a view is interacted with, rather than for every post on startup
+        active_post_items = list(active_posts.items())
+        messages = await asyncio.gather(*[fetch_active_post(msg_id) for msg_id, _ in active_post_items])
+
+        for (_, tweet_details), message in zip(active_post_items, messages):
+            self.add_view(PersistentTweetView(message=message, files=None, tweet_details=tweet_details, bot=self))
 
     def setup_google_topic_listeners(self):
+        from src.modules.google_forms.topic_listener import GoogleTopicListenerManager
+        from src.utils.config import GoogleCloudConfig
+
         topics = GoogleCloudConfig().topics
         self.listener = GoogleTopicListenerManager.init_and_run(
             topic_names=topics if topics else [], client=self, client_loop=self.loop
         )
-        logging.info("Topic manager set up successfully")
+        logger.info("Topic manager set up successfully")
 
 
 client = Orbot()
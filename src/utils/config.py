@@ -1,187 +1,341 @@
+import asyncio
+import copy
+import os
 import re
+import threading
 from typing import Any, List, Literal, Optional, Tuple
 
 import discord
-from ruamel.yaml import YAML
+import yaml
 
-from src.utils.helper import dict_has_key, get_from_dict
+from src.utils.helper import get_from_dict
 
-yaml = YAML(typ="safe")
+try:  # Use the libyaml-based C loader and dumper when PyYAML is built with libyaml
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
 
 
-class RolePickerConfig:
+def load_yaml(stream):
+    """Parses a YAML stream with the safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump_yaml(data, stream):
+    """Serializes data into a YAML stream with the safe dumper."""
+    yaml.dump(data, stream, Dumper=SafeDumper, allow_unicode=True, default_flow_style=None)
+
+
+_yaml_cache = {}  # Maps a file path to a tuple with the structure (`file signature`, `parsed data`)
+_yaml_write_lock = threading.Lock()  # Keeps the writes, which can run in executor threads, from overlapping
+
+
+def get_file_signature(path: str):
+    """Get the modification time and size of a file, which changes whenever the file is written to."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_cached_yaml(path: str):
+    """Loads a YAML file. The parsed data is shared and only re-parsed when the file has been modified."""
+    cached = _yaml_cache.get(path)
+
+    if cached is not None and cached[0] == get_file_signature(path):
+        return cached[1]
+
+    signature = get_file_signature(path)
+
+    with open(path, "r") as file:
+        data = load_yaml(file)
+
+    _yaml_cache[path] = (signature, data)
+    return data
+
+
+def write_yaml_file(data, path: str):
+    """Writes data into a YAML file. Returns the signature of the written file."""
+    # Write to a temporary file first so the file is never left half-written
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as file:
+        dump_yaml(data, file)
+    os.replace(temp_path, path)
+
+    return get_file_signature(path)
+
+
+def dump_cached_yaml(data, path: str):
+    """Dumps data into a YAML file and updates the cache so the next load doesn't need to re-parse the file."""
+    # The cache is only updated once the file is written, so the cache and the file always agree
+    with _yaml_write_lock:
+        _yaml_cache[path] = (write_yaml_file(data, path), data)
+
+
+def get_from_cached_path(path_cache: dict, dic: dict, path: Tuple[str, ...]):
+    """Iterate nested dictionary with `get_from_dict`, memoizing the result under the path in the given cache.
+
+    The cache must be cleared whenever the dictionary is replaced or mutated.
+    """
+    try:
+        return path_cache[path]
+    except KeyError:
+        result = path_cache[path] = get_from_dict(dic, path)
+        return result
+
+
+class YAMLConfig:
+    """The base class of the config classes, which loads its YAML file the first time the data is accessed.
+
+    The parsed data is shared by every instance of a config class, so it must only be modified through `get_data`,
+    which returns a copy, and `dump`. Subclasses must set the `path` class variable to the path of the YAML file.
+    """
+
+    path: str
+
+    def __init__(self) -> None:
+        self._loaded_data = None
+        self._path_cache = {}  # Maps a path in the data to its value, cleared whenever the data changes
+
+    @property
+    def _data(self):
+        """Get the extracted data, loading the YAML file on first access and picking up the data of later dumps."""
+        cached = _yaml_cache.get(self.path)
+        data = load_cached_yaml(self.path) if self._loaded_data is None or cached is None else cached[1]
+
+        if data is not self._loaded_data:  # The data was replaced, i.e. by a dump from another instance
+            self._loaded_data = data
+            self.clear_caches()
+        return data
+
+    def clear_caches(self):
+        """Clears the values derived from the extracted data. Subclasses with their own caches extend this."""
+        self._path_cache = {}
+
+    def get_from_data(self, path: Tuple[str, ...]):
+        """Get a value from the extracted data by its path, memoized until the data changes."""
+        data = self._data  # Accessed first, as it replaces `_path_cache` when the data has changed
+        return get_from_cached_path(self._path_cache, data, path)
+
+    def get_data(self):
+        """Get a copy of the extracted data to be modified and passed to `dump`."""
+        return copy.deepcopy(self._data)
+
+    async def adump(self, data):
+        """Calls `dump` in an executor thread, so writing the file doesn't block the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.dump, data)
+
+
+class RolePickerConfig(YAMLConfig):
     """The RolePickerConfig class helps load the `roles.yaml` file and provides other util methods to manipulate the extracted data."""
 
+    path = "src/data/roles.yaml"
+
     def __init__(self) -> None:
-        with open("src/data/roles.yaml", "r") as roles_file:
-            self._data = yaml.load(roles_file)
+        super().__init__()
+        self._category_index = None  # Maps category names to (`index`, `category`), built on first lookup
+        self._role_index = {}  # Maps role categories to a map of role IDs to (`index`, `role`), built on first lookup
+        self._role_ids_cache = {}  # Maps role categories to a tuple of their role IDs, built on first lookup
+
+    def clear_caches(self):
+        super().clear_caches()
+        self._category_index = None
+        self._role_index = {}
+        self._role_ids_cache = {}
 
     @property
     def role_categories(self):
         """Get the role categories."""
-        return get_from_dict(self._data, ["categories", "role_categories"])
+        return self.get_from_data(("categories", "role_categories"))
 
     @property
     def data(self):
         """Get the extracted data."""
         return self._data
 
-    def get_data(self):
-        """Get a copied version of the extracted data."""
-        return self._data.copy()
-
     def get_roles(self, category: str):
         """Get the list of roles in a role category."""
-        return get_from_dict(self._data, [category, "roles"])
+        return self.get_from_data((category, "roles"))
 
     def get_role_ids(self, category: str):
-        """Get a list of role ids from the roles in a role category."""
-        return [role["id"] for role in self.get_roles(category)]
+        """Get a tuple of role ids from the roles in a role category."""
+        roles = self.get_roles(category)  # Accessed first, as it clears the caches when the data has changed
+        role_ids = self._role_ids_cache.get(category)
+        if role_ids is None:
+            role_ids = self._role_ids_cache[category] = tuple(role["id"] for role in roles)
+        return role_ids
 
     def get_role_category(self, category_name: str):
         """Get the entire role category. Returns a tuple with the structure (`index`, `category`)."""
-        return next(
-            ((idx, category) for idx, category in enumerate(self.role_categories) if category["name"] == category_name),
-            None,
-        )
+        role_categories = self.role_categories  # Accessed first, as it clears the caches when the data has changed
+        if self._category_index is None:
+            self._category_index = {
+                category["name"]: (idx, category) for idx, category in enumerate(role_categories or [])
+            }
+        return self._category_index.get(category_name)
 
     def get_role_by_id(self, role_category: str, role_id: int):
         """Get the entire role by role ID. Returns a tuple with the structure (`index`, `role`)."""
-        return next(
-            ((idx, role) for idx, role in enumerate(self.get_roles(role_category)) if role["id"] == role_id), None
-        )
+        roles = self.get_roles(role_category)  # Accessed first, as it clears the caches when the data has changed
+        role_index = self._role_index.get(role_category)
+        if role_index is None:
+            role_index = {role["id"]: (idx, role) for idx, role in enumerate(roles or [])}
+            self._role_index[role_category] = role_index
+        return role_index.get(role_id)
 
     def generate_option(self, dic: dict, value: Any, defaults: Optional[Any] = None):
         """Generates a list of select options."""
-        option = discord.SelectOption(label=dic["label"], value=value)
+        # Pass the optional fields to the constructor directly rather than setting them one by one afterwards
+        option = discord.SelectOption(
+            label=dic["label"], value=value, description=dic.get("description"), emoji=dic.get("emoji")
+        )
 
         if defaults is not None and option.value in defaults:
             option.default = True
 
-        if dict_has_key(dic, "emoji"):
-            option.emoji = dic["emoji"]
-
-        if dict_has_key(dic, "description"):
-            option.description = dic["description"]
-
         return option
 
     def generate_role_options(self, role_category, defaults: Optional[Any] = None):
         """Generates a list of select options for roles."""
+        defaults = frozenset(defaults) if defaults is not None else None
         return [self.generate_option(role, role["id"], defaults) for role in self.get_roles(role_category)]
 
     def generate_role_category_options(self, defaults: Optional[Any] = None):
         """Generates a list of select options for role categories."""
+        defaults = frozenset(defaults) if defaults is not None else None
         return [self.generate_option(category, category["name"], defaults) for category in self.role_categories]
 
     def generate_all_embeds(self):
         """Generates a list of role category and role embeds."""
         embeds = []
 
-        role_categories_embed = discord.Embed(
-            title="Role Categories", description="Shows the role categories available in this server:\n\u200B"
-        )
-        role_categories_embed.set_footer(text=f"Page 1 of {len(self.role_categories) + 1}")
-
-        for idx, role_category in enumerate(self.role_categories):
-            postfix_text = ""
-            if role_category != self.role_categories[-1]:
-                postfix_text = "\n\u200B"
-
-            role_categories_embed.add_field(
-                name=role_category["label"],
-                value=f"{role_category['description']}{postfix_text}"
-                if dict_has_key(role_category, "description")
-                else f"-No description-{postfix_text}",
-                inline=False,
-            )
-
-            roles = self.get_roles(role_category["name"])
-
-            embed = discord.Embed(
-                title=role_category["label"],
-                description=f"Shows all roles under the {role_category['label']} category\n\u200B",
-            )
-
-            for role in roles:
-                value = f"Server Role: <@&{role['id']}>"
+        role_categories = self.role_categories
+        num_pages = len(role_categories) + 1
+        last_category_idx = num_pages - 2
 
-                if dict_has_key(role, "description"):
-                    value += f"\nDescription: {role['description']}"
+        # Build the fields of each embed first and create the embed in one go, rather than adding fields one by one
+        role_category_fields = []
 
-                if dict_has_key(role, "emoji"):
-                    value += f"\nEmoji: {role['emoji']}"
+        for idx, role_category in enumerate(role_categories):
+            postfix_text = "" if idx == last_category_idx else "\n\u200B"
+            description = role_category.get("description")
 
-                if role != roles[-1]:
-                    value += "\n\u200B"
-
-                embed.add_field(name=role["label"], value=value, inline=False)
+            role_category_fields.append(
+                {
+                    "name": role_category["label"],
+                    "value": f"{description if description is not None else '-No description-'}{postfix_text}",
+                    "inline": False,
+                }
+            )
 
-            embed.set_footer(text=f"Page {idx + 2} of {len(self.role_categories) + 1}")
-            embeds.append(embed)
+            roles = self.get_roles(role_category["name"])
+            last_role_idx = len(roles) - 1
+            role_fields = []
+
+            for role_idx, role in enumerate(roles):
+                value_lines = [f"Server Role: <@&{role['id']}>"]
+
+                description = role.get("description")
+                if description is not None:
+                    value_lines.append(f"Description: {description}")
+
+                emoji = role.get("emoji")
+                if emoji is not None:
+                    value_lines.append(f"Emoji: {emoji}")
+
+                if role_idx != last_role_idx:
+                    value_lines.append("\u200B")
+
+                role_fields.append({"name": role["label"], "value": "\n".join(value_lines), "inline": False})
+
+            embeds.append(
+                discord.Embed.from_dict(
+                    {
+                        "title": role_category["label"],
+                        "description": f"Shows all roles under the {role_category['label']} category\n\u200B",
+                        "fields": role_fields,
+                        "footer": {"text": f"Page {idx + 2} of {num_pages}"},
+                    }
+                )
+            )
 
-        embeds.insert(0, role_categories_embed)
+        role_categories_embed = discord.Embed.from_dict(
+            {
+                "title": "Role Categories",
+                "description": "Shows the role categories available in this server:\n\u200B",
+                "fields": role_category_fields,
+                "footer": {"text": f"Page 1 of {num_pages}"},
+            }
+        )
 
-        return embeds
+        return [role_categories_embed, *embeds]
 
     def generate_role_picker_content(self):
         """Generates a role picker content for the embed."""
-        content = "Welcome to the LOONA Discord server's own Role Picker!\n\n__**Role Categories**__\n"
+        content_lines = ["Welcome to the LOONA Discord server's own Role Picker!\n\n__**Role Categories**__"]
 
         embed = discord.Embed(title="**__Available Roles__**")
 
+        # Pair each role category with its roles, filtering out role categories that do not have roles
         role_categories = [
-            role_category for role_category in self.role_categories if self.get_roles(role_category["name"]) is not None
-        ]  # Filter out role categories that do not have roles
-
-        for role_category in role_categories:
-            content += f'`{role_category["label"]}`'
-
-            if dict_has_key(role_category, "description"):
-                content += f' ➡️ {role_category["description"]}'
-
-            content += "\n"
+            (role_category, roles)
+            for role_category in self.role_categories
+            if (roles := self.get_roles(role_category["name"])) is not None
+        ]
 
-            roles = self.get_roles(role_category["name"])
+        last_category_idx = len(role_categories) - 1
 
-            value = ""
-            for role in roles:
-                value += f'`{role["label"]}`'
+        for idx, (role_category, roles) in enumerate(role_categories):
+            description = role_category.get("description")
+            if description is not None:
+                content_lines.append(f'`{role_category["label"]}` ➡️ {description}')
+            else:
+                content_lines.append(f'`{role_category["label"]}`')
 
-                if role != roles[-1]:
-                    value += ", "
+            value = ", ".join(f'`{role["label"]}`' for role in roles)
 
-            if role_category != role_categories[-1]:
+            if idx != last_category_idx:
                 value += "\n\u200B"
 
             embed.add_field(name=f"{role_category['label']} Roles", value=value, inline=False)
 
-        content += "\n⚠️ For more information on specific roles, descriptions are provided in the select menus\n⚠️ Roles in the LOOΠΔ (Main) category are ordered from OT12 - subunits - individual member roles. The exact order is shown in the select menu. If you'd like your role to be a specific color, make sure all the roles before that aren't selected"
+        content_lines.append(
+            "\n⚠️ For more information on specific roles, descriptions are provided in the select menus\n⚠️ Roles in the LOOΠΔ (Main) category are ordered from OT12 - subunits - individual member roles. The exact order is shown in the select menu. If you'd like your role to be a specific color, make sure all the roles before that aren't selected"
+        )
+        content = "\n".join(content_lines)
 
         return content, embed
 
     def dump(self, data):
         """Dump data into the `roles.yaml` file."""
-        with open("src/data/roles.yaml", "w") as roles_file:
-            yaml.dump(data, roles_file)
+        dump_cached_yaml(data, self.path)
 
 
-class ContentPosterConfig:
+class ContentPosterConfig(YAMLConfig):
     """The ContentPosterConfig class helps load the `content_poster.yaml` file and provides other util methods to manipulate the extracted data."""
 
+    # Static class variables
+    path = "src/data/content_poster.yaml"
+    credits_pattern = re.compile(r"cr:\s(?P<name>.+?)\s*\(@(?P<username>.+?)\)")  # Matches `cr: name (@username)`
+    caption_content_pattern = re.compile(r"(.+)\s\|")  # Matches the caption content before the credits
+    custom_caption_pattern = re.compile(r"\n(.+)")  # Matches the caption content of a caption without credits
+
     def __init__(self) -> None:
-        with open("src/data/content_poster.yaml", "r") as content_poster_file:
-            self._data = yaml.load(content_poster_file)
+        super().__init__()
+        self._post_channel_index = None  # Maps channel IDs to (`index`, `channel`), built on first lookup
+
+    def clear_caches(self):
+        super().clear_caches()
+        self._post_channel_index = None
 
     @property
     def post_channels(self):
         """Get the post channels."""
-        return get_from_dict(self._data, ["config", "post_channels"])
+        return self.get_from_data(("config", "post_channels"))
 
     @property
     def hashtag_filters(self):
         """Get hashtag filters."""
-        return get_from_dict(self._data, ["config", "hashtag_filters"])
+        return self.get_from_data(("config", "hashtag_filters"))
 
     @property
     def data(self):
@@ -191,18 +345,14 @@ class ContentPosterConfig:
     @property
     def active_posts(self):
         """Get the active posts object."""
-        return get_from_dict(self._data, ["active_posts"])
+        return self.get_from_data(("active_posts",))
 
     @staticmethod
     def generate_post_caption(
         caption_credits: Optional[Tuple[str, str]] = None, post_caption_details: Optional[dict] = None
     ):
         """Generates the post caption."""
-        if (
-            post_caption_details is not None
-            and post_caption_details != {}
-            and dict_has_key(post_caption_details, "caption")
-        ):
+        if post_caption_details and "caption" in post_caption_details:
             caption = f'```ml\n{post_caption_details["caption"].replace("```", "")} '
 
             if caption_credits is not None and post_caption_details["has_credits"]:
@@ -216,27 +366,25 @@ class ContentPosterConfig:
     @staticmethod
     def anatomize_post_caption(caption: str):
         """Breaks down the post caption and extracts the caption credits."""
-        name = re.search(r"cr:\s{1}.+?\(", caption)
-        username = re.search(r"\(@.+?\)", caption)
+        credits = ContentPosterConfig.credits_pattern.search(caption)
 
-        if name is not None and username is not None:
-            # Split the name by removing `cr: ` and username by removing the `@()`
-            return (name.group()[4:-2], username.group()[2:-1])
+        if credits is not None:
+            return (credits["name"], credits["username"])
 
         return None
 
     @staticmethod
     def get_post_caption_content(caption: str):
         """Breaks down the post caption and extracts the contents."""
-        content = re.search(r".+\s{1}\|", caption)
+        content = ContentPosterConfig.caption_content_pattern.search(caption)
         has_credits = True
 
         if content is None:
             # Return a custom caption
-            content = re.search(r"\n.+", caption).group().strip()
+            content = ContentPosterConfig.custom_caption_pattern.search(caption).group(1).strip()
             has_credits = False
         else:
-            content = content.group()[:-2]
+            content = content.group(1)
 
         return {"caption": content, "has_credits": has_credits}
 
@@ -247,19 +395,18 @@ class ContentPosterConfig:
         except:
             return None
 
-    def get_data(self):
-        """Get a copied version of the extracted data."""
-        return self._data.copy()
-
     def get_post_channel(self, channel_id: str):
         """Search for a post channel. Returns a tuple with the structure (`index`, `channel`)."""
-        return next(
-            ((idx, channel) for idx, channel in enumerate(self.post_channels) if channel["id"] == channel_id),
-            None,
-        )
+        post_channels = self.post_channels  # Accessed first, as it clears the caches when the data has changed
+        if self._post_channel_index is None:
+            self._post_channel_index = {
+                channel["id"]: (idx, channel) for idx, channel in enumerate(post_channels or [])
+            }
+        return self._post_channel_index.get(channel_id)
 
     def generate_post_channel_options(self, defaults: Optional[List[str]] = None):
         """Generates a list of select options for post channels."""
+        defaults = frozenset(defaults) if defaults is not None else None
         return [
             discord.SelectOption(
                 label=post_channel["label"],
@@ -283,40 +430,33 @@ class ContentPosterConfig:
 
     def dump(self, data):
         """Dump data into the `content_poster.yaml` file."""
-        with open("src/data/content_poster.yaml", "w") as content_poster_file:
-            yaml.dump(data, content_poster_file)
+        dump_cached_yaml(data, self.path)
 
 
-class GoogleCloudConfig:
+class GoogleCloudConfig(YAMLConfig):
     """The GoogleCloudConfig class helps load the `google_cloud.yaml` file and provides other util methods to manipulate the extracted data."""
 
-    def __init__(self) -> None:
-        with open("src/data/google_cloud.yaml", "r") as google_cloud_file:
-            self._data = yaml.load(google_cloud_file)
+    path = "src/data/google_cloud.yaml"
 
     @property
     def active_form_watches(self) -> dict | None:
         """Get the list of active form watches."""
-        return get_from_dict(self._data, ["active_form_watches"])
+        return self.get_from_data(("active_form_watches",))
 
     @property
     def active_form_schemas(self) -> dict | None:
         """Get the list of active form schemas."""
-        return get_from_dict(self._data, ["active_form_schemas"])
+        return self.get_from_data(("active_form_schemas",))
 
     @property
     def form_channel_id(self):
         """Get the default broadcast channel ID."""
-        return get_from_dict(self._data, ["form_channel_id"])
+        return self.get_from_data(("form_channel_id",))
 
     @property
     def topics(self):
         """Get the list of Google Topic subscription paths."""
-        return get_from_dict(self._data, ["topics"])
-
-    def get_data(self):
-        """Get a copied version of the extracted data."""
-        return self._data.copy()
+        return self.get_from_data(("topics",))
 
     def get_question_details(self, question_id: str, form_id: str):
         """Get the question title based on the question ID and form ID."""
@@ -333,28 +473,17 @@ class GoogleCloudConfig:
         topic_name: Optional[str] = None,
     ):
         """Search the `google_cloud.yaml` file for an active form watch."""
-        result = get_from_dict(self.active_form_watches, [form_id])
-
-        def is_valid(watch: dict):
-            if watch["form_id"] != form_id:
-                return False
-            if watch_id and not watch["watch_id"] == watch_id:
-                return False
-            if event_type and not watch["event_type"] == event_type:
-                return False
-            if topic_name and not watch["topic_name"] == topic_name:
-                return False
+        # The watches are already grouped by form ID, so only the optional filters need to be checked
+        for idx, watch in enumerate(get_from_dict(self.active_form_watches, [form_id]) or []):
+            if watch_id and watch["watch_id"] != watch_id:
+                continue
+            if event_type and watch["event_type"] != event_type:
+                continue
+            if topic_name and watch["topic_name"] != topic_name:
+                continue
             # TODO: Double check the expiry date with the current date
-            return True
-
-        if result:
-            result = next(
-                ((idx, watch) for idx, watch in enumerate(result) if is_valid(watch)),
-                (None, None),
-            )
-        else:
-            result = (None, None)
-        return result
+            return idx, watch
+        return None, None
 
     def search_active_form_watches(self, form_id: str):
         """Search the `google_cloud.yaml` file for all form watches under a specific form ID."""
@@ -415,11 +544,21 @@ class GoogleCloudConfig:
         """Delete a form watch object in the `google_cloud.yaml` file based on the index under a specific form ID."""
         data = self.get_data()
 
+        # Group the indexes to delete by form ID, so each list of watches is rebuilt once
+        # - The indexes refer to the original positions, so deleting them one by one would shift the later indexes
+        delete_idxs_per_form = {}
         for idx, watch in form_watches:
-            del data["active_form_watches"][watch["form_id"]][idx]
+            delete_idxs_per_form.setdefault(watch["form_id"], set()).add(idx)
+
+        for form_id, delete_idxs in delete_idxs_per_form.items():
+            watches = [
+                watch for idx, watch in enumerate(data["active_form_watches"][form_id]) if idx not in delete_idxs
+            ]
 
-            if len(data["active_form_watches"][watch["form_id"]]) == 0:
-                del data["active_form_watches"][watch["form_id"]]
+            if len(watches) == 0:
+                del data["active_form_watches"][form_id]
+            else:
+                data["active_form_watches"][form_id] = watches
 
         self.dump(data=data)
 
@@ -464,25 +603,18 @@ class GoogleCloudConfig:
 
     def dump(self, data):
         """Dump data into the `google_cloud.yaml` file."""
-        with open("src/data/google_cloud.yaml", "w") as google_cloud_file:
-            yaml.dump(data, google_cloud_file)
+        dump_cached_yaml(data, self.path)
 
 
-class ThreadEventsConfig:
+class ThreadEventsConfig(YAMLConfig):
     """The ThreadEventsConfig class helps load the `thread_events.yaml` file and provides other util methods to manipulate the extracted data."""
 
-    def __init__(self) -> None:
-        with open("src/data/thread_events.yaml", "r") as forum_events_file:
-            self._data = yaml.load(forum_events_file)
+    path = "src/data/thread_events.yaml"
 
     @property
     def events(self):
         """Get the list of thread events."""
-        return get_from_dict(self._data, ["events"])
-
-    def get_data(self):
-        """Get a copied version of the extracted data."""
-        return self._data.copy()
+        return self.get_from_data(("events",))
 
     def get_thread_event(self, event: Literal["on_thread_create", "on_thread_update"], channel_id: int):
         """Get a specific thread event based on the provided event and channel ID."""
@@ -524,5 +656,4 @@ class ThreadEventsConfig:
 
     def dump(self, data):
         """Dump data into the `thread_events.yaml` file."""
-        with open("src/data/thread_events.yaml", "w") as forum_events_file:
-            yaml.dump(data, forum_events_file)
+        dump_cached_yaml(data, self.path)
@@ -1,7 +1,7 @@
+import asyncio
 import io
 import zipfile
-from dataclasses import _MISSING_TYPE, MISSING
-from functools import reduce
+from dataclasses import MISSING
 from typing import List, Optional, Sequence
 
 import aiohttp
@@ -10,15 +10,25 @@ import discord
 
 def get_from_dict(dic, map_list):
     """Iterate nested dictionary. Returns `None` if not key is not found."""
-    try:
-        return reduce(dict.get, map_list, dic)
-    except TypeError:
-        return None
+    for key in map_list:
+        if not isinstance(dic, dict):
+            return None
+        dic = dic.get(key)
+    return dic
 
 
 def dict_has_key(dic, key):
     """Whether or not a dictionary has a given key. Returns `True` or `False`"""
-    return key in dic.keys()
+    return key in dic
+
+
+class DownloadError(Exception):
+    """Raised when a file cannot be downloaded."""
+
+    def __init__(self, url: str, status: Optional[int] = None):
+        super().__init__(f"Cannot download file from {url}" + (f" (status {status})" if status is not None else ""))
+        self.url = url
+        self.status = status
 
 
 async def download_files(urls: List[str], filenames: Optional[List[str]] = None):
@@ -33,30 +43,69 @@ async def download_files(urls: List[str], filenames: Optional[List[str]] = None)
     """
     if filenames is not None and len(filenames) != len(urls):
         raise Exception
-    return [
-        await download_file(url, filenames[idx] if filenames is not None else idx + 1) for idx, url in enumerate(urls)
-    ]
 
-
-async def download_file(url: str, name: str):
+    # Download the files concurrently over one session, so the connections are reused
+    # - Limit the connections per host so a large batch of media doesn't get throttled by the host
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=6)) as session:
+        tasks = [
+            asyncio.ensure_future(download_file(url, filenames[idx] if filenames is not None else idx + 1, session))
+            for idx, url in enumerate(urls)
+        ]
+
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Stop the remaining downloads before the session is closed, so none of them outlive it
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+async def download_file(url: str, name: str, session: Optional[aiohttp.ClientSession] = None, retries: int = 3):
     """Downloads a single file. Returns a downloaded `discord.File` instance.
 
+    Server errors and connection errors are retried with an exponential backoff, other errors raise a `DownloadError`.
+
     Parameters
     ----------
         * url: :class:`str`
             - The url to download.
         * name: :class:`str`
             - The name of the downloaded file.
+        * session: Optional[:class:`aiohttp.ClientSession`] | None
+            - The session to download the file with. If `None` is provided, a new session is created.
+        * retries: :class:`int` | 3
+            - The maximum number of attempts to download the file. Must be at least 1.
     """
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as resp:
-            if resp.status != 200:
-                raise Exception("Cannot download file")
-            data = io.BytesIO(await resp.read())
-            return discord.File(data, name)
+    if retries < 1:
+        raise ValueError("retries must be at least 1")
+
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await download_file(url, name, session, retries)
+
+    for attempt in range(retries):
+        is_last_attempt = attempt == retries - 1
 
+        try:
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    return discord.File(io.BytesIO(await resp.read()), name)
 
-async def convert_files_to_zip(files: List[discord.File], filename: Optional[str] = None):
+                # The response body is never read on errors, so the connection is released straight away
+                if resp.status < 500 or is_last_attempt:
+                    raise DownloadError(url, resp.status)
+        except aiohttp.ClientError as error:
+            if is_last_attempt:
+                raise DownloadError(url) from error
+
+        await asyncio.sleep(0.2 * 2**attempt)
+
+
+async def convert_files_to_zip(
+    files: List[discord.File], filename: Optional[str] = None, compression: int = zipfile.ZIP_STORED
+):
     """Converts a list of `discord.File`s to a ZIP file.
 
     Parameters
@@ -65,11 +114,15 @@ async def convert_files_to_zip(files: List[discord.File], filename: Optional[str
             - The list of files to compress into a ZIP file.
         * filename: Optional[:class:`str`] | None
             - The name of the ZIP file.
+        * compression: :class:`int` | `zipfile.ZIP_STORED`
+            - The compression method. Default is no compression, as images and videos are already compressed.
     """
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, False) as zip_file:
+    with zipfile.ZipFile(zip_buffer, "w", compression, False) as zip_file:
         for discord_file in files:
-            zip_file.writestr(discord_file.filename, discord_file.fp.getvalue())
+            # Read the downloaded buffer in place instead of copying it with `getvalue`
+            with discord_file.fp.getbuffer() as data:
+                zip_file.writestr(discord_file.filename, data)
 
     zip_buffer.seek(0)
     filename = f"{filename}.zip" if filename is not None else "images.zip"
@@ -102,32 +155,25 @@ async def send_or_edit_interaction_message(
     """
     # Get the keyword arguments
     # - Need to get the keywords this way because certain attributes do not allow `None` type if it was not set prior
-    kwargs = {}
+    kwargs = {
+        key: value for key, value in (("view", view), ("embed", embed), ("embeds", embeds)) if value is not MISSING
+    }
 
-    if not isinstance(view, _MISSING_TYPE):
-        kwargs["view"] = view
-
-    if not isinstance(embed, _MISSING_TYPE):
-        kwargs["embed"] = embed
-
-    if not isinstance(embeds, _MISSING_TYPE):
-        kwargs["embeds"] = embeds
+    response = interaction.response
+    is_done = response.is_done()
 
     # Need to check whether interaction response was not responded to before and not to be edited
     # - `file` and `files` only work in new interaction messages and followup messages
-    if not isinstance(file, _MISSING_TYPE) and (not interaction.response.is_done() or not edit_original_response):
-        kwargs["file"] = file
-
-    if not isinstance(files, _MISSING_TYPE) and (not interaction.response.is_done() or not edit_original_response):
-        kwargs["files"] = files
+    if not is_done or not edit_original_response:
+        kwargs.update({key: value for key, value in (("file", file), ("files", files)) if value is not MISSING})
 
     # `attachments` attribute only works when interaction is responded to before and to be edited
-    if not isinstance(attachments, _MISSING_TYPE) and interaction.response.is_done() and edit_original_response:
+    if attachments is not MISSING and is_done and edit_original_response:
         kwargs["attachments"] = attachments
 
     try:
-        if not interaction.response.is_done():  # Send a new message using the interaction
-            await interaction.response.send_message(
+        if not is_done:  # Send a new message using the interaction
+            await response.send_message(
                 content=content,
                 tts=tts,
                 ephemeral=ephemeral,
@@ -163,8 +209,8 @@ async def send_or_edit_interaction_message(
                 **kwargs,
             )
     except Exception:  # To handle any errors that occurs
-        if not interaction.response.is_done():
-            await interaction.response.send_message(
+        if not response.is_done():
+            await response.send_message(
                 content="Error occurred while sending a message.", ephemeral=True, delete_after=10
             )
             return await interaction.original_response()
@@ -6,6 +6,8 @@ import discord
 from src.modules.ui.custom import CancelView
 from src.utils.config import ContentPosterConfig
 
+USER_INPUT_FOOTER = "Data is recorded successfully when the previous embed is updated with the data."
+
 
 async def send_input_message(bot: discord.Client, input_name: str, interaction: discord.Interaction):
     """Sends an embedded message stating the input name and channel to record the user inputted data.
@@ -24,13 +26,15 @@ async def send_input_message(bot: discord.Client, input_name: str, interaction:
         title=f"Enter {input_name}",
         description=f"The next message you send in <#{feed_channel.id}> will be recorded as the {input_name}",
     )
-    user_input_embed.set_author(name=interaction.user.display_name, icon_url=interaction.user.avatar)
-    user_input_embed.set_footer(text="Data is recorded successfully when the previous embed is updated with the data.")
+    user = interaction.user
+    user_input_embed.set_author(name=user.display_name, icon_url=user.avatar)
+    user_input_embed.set_footer(text=USER_INPUT_FOOTER)
 
     cancel_view = CancelView(timeout=60)
 
-    if not interaction.response.is_done():
-        await interaction.response.send_message(embed=user_input_embed, view=cancel_view, ephemeral=True)
+    response = interaction.response
+    if not response.is_done():
+        await response.send_message(embed=user_input_embed, view=cancel_view, ephemeral=True)
         message = await interaction.original_response()
     else:
         message = await interaction.followup.send(embed=user_input_embed, view=cancel_view, ephemeral=True, wait=True)
@@ -47,8 +51,14 @@ async def get_user_input(tasks: List[asyncio.Task], cleanup: Optional[Callable[[
         * cleanup: Optional[Callable[[], Awaitable[None]] | None
             - An optional callback that cleans up the threads after.
     """
-    finished, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-    result = list(finished)[0].result()
+    try:
+        result = await next(asyncio.as_completed(tasks))
+    finally:
+        # The remaining tasks are no longer needed once one of them has completed, even if it raised
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
     if cleanup is not None:
         await cleanup()
     return result